@@ -1,104 +1,415 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import functools
+import hashlib
 import click
-from github import Github
+import aiohttp
 from datetime import datetime, timedelta
-import os
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import sqlite3
+import sys
+import threading
 import time
 import json
 
-CACHE_FILE = ".gh_commit_cache.json"
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    _json_dumps = json.dumps
+    _json_loads = json.loads
+
+CACHE_FILE = ".gh_commit_cache.db"
 CACHE_TTL = 15 * 60  # 15 minutes in seconds
+DIFF_CACHE_FILE = ".gh_diff_cache.db"
+LLM_CACHE_FILE = ".gh_llm_cache.db"
+LLM_CACHE_TTL = 30 * 24 * 60 * 60  # 30 days in seconds
 
-def get_github_commits(token, date):
-    g = Github(token)
-    user = g.get_user()
-    repos = user.get_repos()
-    all_commits = []
+API_URL = "https://api.github.com"
+GRAPHQL_URL = f"{API_URL}/graphql"
+MAX_CONCURRENT_REQUESTS = 20
+HTTP_RETRIES = 5
+HTTP_BACKOFF_FACTOR = 0.5
+HTTP_RETRY_STATUSES = (502, 503, 504)
+
+VIEWER_QUERY = "query { viewer { id } }"
+
+COMMITS_QUERY = """
+query($viewerId: ID!, $since: GitTimestamp!, $until: GitTimestamp!, $cursor: String) {
+  viewer {
+    repositories(first: 100, after: $cursor, ownerAffiliations: [OWNER, COLLABORATOR, ORGANIZATION_MEMBER]) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        nameWithOwner
+        defaultBranchRef {
+          target {
+            ... on Commit {
+              history(first: 100, since: $since, until: $until, author: {id: $viewerId}) {
+                pageInfo { hasNextPage endCursor }
+                nodes { oid messageHeadline }
+              }
+            }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+HISTORY_QUERY = """
+query($owner: String!, $name: String!, $viewerId: ID!, $since: GitTimestamp!, $until: GitTimestamp!, $cursor: String) {
+  repository(owner: $owner, name: $name) {
+    defaultBranchRef {
+      target {
+        ... on Commit {
+          history(first: 100, after: $cursor, since: $since, until: $until, author: {id: $viewerId}) {
+            pageInfo { hasNextPage endCursor }
+            nodes { oid messageHeadline }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+class RateLimitError(Exception):
+    def __init__(self, reset):
+        self.reset = reset
+        super().__init__(f"GitHub API rate limit exceeded, resets at {datetime.fromtimestamp(reset):%H:%M:%S}")
+
+def _check_rate_limit(status, headers, rate_limited=False):
+    # Secondary rate limits answer 403/429 with Retry-After, whatever quota remains
+    if status in (403, 429) and headers.get("Retry-After", "").isdigit():
+        raise RateLimitError(int(time.time()) + int(headers["Retry-After"]))
+    # GitHub reports an exhausted quota with 403/429 (REST) or a RATE_LIMITED error (GraphQL)
+    if headers.get("X-RateLimit-Remaining") == "0" and (rate_limited or status in (403, 429)):
+        raise RateLimitError(int(headers.get("X-RateLimit-Reset", time.time())))
+
+def _rate_limit_wait(e):
+    # One extra second so the retry lands after the quota has actually reset
+    wait = max(0, e.reset - time.time()) + 1
+    print(f"{e}; waiting {int(wait)}s before retrying...")
+    return wait
+
+def create_session(token):
+    session = requests.Session()
+    session.headers["Authorization"] = f"bearer {token}"
+    retry = Retry(
+        total=HTTP_RETRIES,
+        backoff_factor=HTTP_BACKOFF_FACTOR,
+        status_forcelist=HTTP_RETRY_STATUSES,
+        allowed_methods=frozenset(["GET", "POST"]),  # GraphQL queries are POSTs but safe to retry
+    )
+    adapter = HTTPAdapter(pool_connections=MAX_CONCURRENT_REQUESTS, pool_maxsize=MAX_CONCURRENT_REQUESTS, max_retries=retry)
+    session.mount("https://", adapter)
+    return session
+
+def _graphql(session, query, variables=None):
+    try:
+        return _graphql_request(session, query, variables)
+    except RateLimitError as e:
+        time.sleep(_rate_limit_wait(e))
+        return _graphql_request(session, query, variables)
+
+def _graphql_request(session, query, variables):
+    resp = session.post(GRAPHQL_URL, json={"query": query, "variables": variables or {}})
+    _check_rate_limit(resp.status_code, resp.headers)
+    resp.raise_for_status()
+    payload = resp.json()
+    errors = payload.get("errors") or []
+    if errors:
+        _check_rate_limit(resp.status_code, resp.headers, any(e.get("type") == "RATE_LIMITED" for e in errors))
+    if payload.get("data") is None:
+        raise RuntimeError(f"GitHub GraphQL error: {errors[0].get('message') if errors else 'no data returned'}")
+    # Partial results: an unreadable repo (e.g. SAML enforcement) nulls its own node, the rest is usable
+    for error in errors:
+        path = ".".join(str(p) for p in error.get("path") or [])
+        print(f"Skipping {path or 'part of the response'}: {error.get('message')}", file=sys.stderr)
+    return payload["data"]
+
+def _history(branch_ref):
+    target = (branch_ref or {}).get("target") or {}
+    return target.get("history") or {"nodes": [], "pageInfo": {"hasNextPage": False}}
+
+def _remaining_history(session, full_name, variables, cursor):
+    owner, name = full_name.split("/", 1)
+    nodes = []
+    while cursor:
+        page_vars = dict(variables, owner=owner, name=name, cursor=cursor)
+        repo = _graphql(session, HISTORY_QUERY, page_vars)["repository"] or {}
+        history = _history(repo.get("defaultBranchRef"))
+        nodes.extend(history["nodes"])
+        cursor = history["pageInfo"]["endCursor"] if history["pageInfo"]["hasNextPage"] else None
+    return nodes
+
+def get_viewer_id(session):
+    # The token always maps to the same account, so its node id is cached for good
+    key = "viewer:" + hashlib.sha256(session.headers["Authorization"].encode()).hexdigest()
+    viewer_id = db_get(CACHE_FILE, key)
+    if viewer_id is None:
+        viewer_id = _graphql(session, VIEWER_QUERY)["viewer"]["id"]
+        db_put(CACHE_FILE, key, viewer_id)
+    return viewer_id
+
+def get_github_commits(session, date):
     since = datetime.strptime(date, '%Y-%m-%d')
     until = since + timedelta(days=1)
-    for repo in repos:
-        try:
-            commits = repo.get_commits(author=user, since=since, until=until)
-            commit_list = [f"{c.sha[:7]} {c.commit.message.splitlines()[0]}" for c in commits]
+    variables = {
+        "viewerId": get_viewer_id(session),
+        "since": since.isoformat() + "Z",
+        "until": until.isoformat() + "Z",
+    }
+    all_commits = []
+    cursor = None
+    while True:
+        repos = _graphql(session, COMMITS_QUERY, dict(variables, cursor=cursor))["viewer"]["repositories"]
+        for node in repos["nodes"]:
+            if node is None:
+                continue
+            history = _history(node.get("defaultBranchRef"))
+            nodes = history["nodes"]
+            if history["pageInfo"]["hasNextPage"]:
+                # More than one page of commits on this branch for the day
+                nodes = nodes + _remaining_history(session, node["nameWithOwner"], variables, history["pageInfo"]["endCursor"])
+            commit_list = [f"{c['oid'][:7]} {c['messageHeadline']}" for c in nodes if c]
             if commit_list:
-                all_commits.append((repo.full_name, commit_list))
-        except Exception:
-            continue
+                all_commits.append((node["nameWithOwner"], commit_list))
+        if not repos["pageInfo"]["hasNextPage"]:
+            break
+        cursor = repos["pageInfo"]["endCursor"]
     return all_commits
 
-def get_commit_diffs(repo, commits):
-    diffs = []
-    for commit in commits:
-        try:
-            c = repo.get_commit(commit.split()[0])
-            diff = c.files
-            diff_text = "\n".join([f.filename + "\n" + (f.patch or "") for f in diff if hasattr(f, 'patch')])
-            diffs.append((commit, diff_text))
-        except Exception:
-            diffs.append((commit, "[Diff not available]"))
-    return diffs
-
-def create_ai_prompt(repo_name, commit_diffs, date):
-    prompt = f"""
-You are an expert software engineer. Summarize the following git commit diffs for repository '{repo_name}' for {date}. Focus on the main changes, improvements, and bug fixes. Be concise and clear.
+MAX_DIFF_LINE_LENGTH = 200
 
-"""
-    for commit, diff in commit_diffs:
-        prompt += f"Commit: {commit}\nDiff:\n{diff}\n\n"
-    prompt += "\nSummary:"
-    return prompt
+def _compress_diff(patch):
+    lines = []
+    for line in patch.splitlines():
+        # Keep only added/removed lines; context and hunk headers cost tokens without adding signal.
+        # GitHub's per-file patch has no ---/+++ file headers, so "---" here is a removed "--" line.
+        if not line.startswith(("+", "-")):
+            continue
+        line = line[0] + " ".join(line[1:].split())
+        if len(line) == 1 and lines and lines[-1] == line:
+            continue
+        lines.append(line[:MAX_DIFF_LINE_LENGTH])
+    return "\n".join(lines)
+
+def _with_token_count(commit, diff):
+    # Measured once here so prompt budgeting can sum counts instead of retokenizing
+    return (commit, diff, estimate_token_count(_commit_chunk(commit, diff)))
 
+DIFF_UNAVAILABLE_STATUSES = (403, 404, 409, 422)  # No access, gone, empty repository, or unknown SHA
+
+async def _get_commit(session, semaphore, repo_name, sha):
+    # Same retry policy as create_session's urllib3 Retry, which aiohttp has no equivalent of
+    for attempt in range(HTTP_RETRIES + 1):
+        async with semaphore:
+            async with session.get(f"{API_URL}/repos/{repo_name}/commits/{sha}") as resp:
+                # Rate-limit 403s raise here; any other 403 is a per-repo access denial
+                _check_rate_limit(resp.status, resp.headers)
+                if resp.status in DIFF_UNAVAILABLE_STATUSES:
+                    return None
+                if resp.status not in HTTP_RETRY_STATUSES or attempt == HTTP_RETRIES:
+                    resp.raise_for_status()
+                    return await resp.json()
+        await asyncio.sleep(HTTP_BACKOFF_FACTOR * 2 ** attempt)
+
+async def _fetch_commit_diff(session, semaphore, repo_name, commit):
+    sha = commit.split()[0]
+    key = f"{repo_name}@{sha}"
+    cached = db_get(DIFF_CACHE_FILE, key)
+    if cached is not None:
+        return _with_token_count(commit, cached)
+    try:
+        data = await _get_commit(session, semaphore, repo_name, sha)
+    except RateLimitError as e:
+        await asyncio.sleep(_rate_limit_wait(e))
+        data = await _get_commit(session, semaphore, repo_name, sha)
+    if data is None:
+        return _with_token_count(commit, "[Diff not available]")
+    files = data.get("files") or []
+    diff_text = "\n".join([f["filename"] + "\n" + _compress_diff(f.get("patch") or "") for f in files])
+    # A commit SHA never changes, so its diff is cached without a TTL
+    db_put(DIFF_CACHE_FILE, key, diff_text)
+    return _with_token_count(commit, diff_text)
+
+async def get_commit_diffs(session, semaphore, repo_name, commits):
+    return await asyncio.gather(*[_fetch_commit_diff(session, semaphore, repo_name, c) for c in commits])
+
+async def _fetch_all_diffs(token, gh_commits):
+    headers = {"Authorization": f"token {token}", "Accept": "application/vnd.github+json"}
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    connector = aiohttp.TCPConnector(limit=MAX_CONCURRENT_REQUESTS)
+    async with aiohttp.ClientSession(headers=headers, connector=connector) as session:
+        results = await asyncio.gather(
+            *[get_commit_diffs(session, semaphore, repo_name, commits) for repo_name, commits in gh_commits]
+        )
+    return [(repo_name, diffs) for (repo_name, _), diffs in zip(gh_commits, results)]
+
+@functools.lru_cache(maxsize=None)
+def _encoding():
+    # Loaded on first use: tiktoken may need to download the BPE file, so any failure
+    # (missing extra, no network, no cache) falls back to the character estimate
+    try:
+        import tiktoken
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        return None
+
+@functools.lru_cache(maxsize=4096)
 def estimate_token_count(text):
+    enc = _encoding()
+    if enc is not None:
+        return len(enc.encode(text, disallowed_special=()))
     # Rough estimate: 1 token ≈ 4 characters (for English text)
     return len(text) // 4
 
 AI_CONTEXT_LIMIT = 15000
 AI_SUMMARY_LIMIT = 12000  # Leave room for response
+ROLLUP_MIN_TOKENS = 500  # Batch summaries shorter than this are printed without a rollup
+
+PROMPT_HEADER = """
+You are an expert software engineer. Summarize the following git commit diffs for repository '{repo_name}' for {date}. Focus on the main changes, improvements, and bug fixes. Be concise and clear.
+
+"""
+PROMPT_FOOTER = "\nSummary:"
+
+def _truncate_to_tokens(text, limit):
+    enc = _encoding()
+    if enc is not None:
+        text = enc.decode(enc.encode(text, disallowed_special=())[:limit])
+    else:
+        text = text[:limit * 4]
+    # Drop the partial last line so the diff is cut on a line boundary
+    return text[:text.rfind("\n")] if "\n" in text else text
+
+def _prompt_overhead(repo_name, date):
+    return estimate_token_count(PROMPT_HEADER.format(repo_name=repo_name, date=date)) + estimate_token_count(PROMPT_FOOTER)
+
+def _commit_chunk(commit, diff):
+    return f"Commit: {commit}\nDiff:\n{diff}\n\n"
+
+def batch_commit_diffs(repo_name, commit_diffs, date, budget):
+    overhead = _prompt_overhead(repo_name, date)
+    batches = []
+    batch, used = [], overhead
+    for commit_diff in commit_diffs:
+        tokens = commit_diff[2] + 1  # Matches the per-chunk slack in create_ai_prompt
+        if batch and used + tokens > budget:
+            batches.append(batch)
+            batch, used = [], overhead
+        # A diff too big for the budget on its own gets a batch to itself and is truncated
+        batch.append(commit_diff)
+        used += tokens
+    if batch:
+        batches.append(batch)
+    return batches
+
+def create_ai_prompt(repo_name, commit_diffs, date, budget):
+    # One token of slack per chunk, since counts can shift by a token when the parts are joined
+    remaining = budget - _prompt_overhead(repo_name, date) - len(commit_diffs)
+    parts = [PROMPT_HEADER.format(repo_name=repo_name, date=date)]
+    # Commits arrive newest first, so the most recent ones get the budget first
+    for commit, diff, chunk_tokens in commit_diffs:
+        chunk = _commit_chunk(commit, diff)
+        if chunk_tokens > remaining:
+            label = f"Commit: {commit}\nDiff:\n"
+            marker = f"\n... [diff truncated: {chunk_tokens} tokens]\n\n"
+            room = remaining - estimate_token_count(label) - estimate_token_count(marker)
+            if room <= 0:
+                break
+            chunk = label + _truncate_to_tokens(diff, room) + marker
+            chunk_tokens = estimate_token_count(chunk)
+        parts.append(chunk)
+        remaining -= chunk_tokens
+    parts.append(PROMPT_FOOTER)
+    return "".join(parts)
+
+def create_final_prompt(repo_name, labelled_summaries, date):
+    parts = [f"You are an expert software engineer. Summarize the following commit summaries for repository '{repo_name}' for {date}.\n"]
+    parts.extend(f"Commits: {label}\nSummary: {summary}" for label, summary in labelled_summaries)
+    parts.append("\nFinal Summary:")
+    return "\n".join(parts)
+
+_LLM = None
+_LLM_LOCK = threading.Lock()
+
+def _llm():
+    global _LLM
+    with _LLM_LOCK:
+        if _LLM is None:
+            import lmstudio as lms
+            _LLM = lms.llm()
+    return _LLM
 
 def get_ai_summary(prompt):
     try:
-        import lmstudio as lms
-        model = lms.llm()
         if estimate_token_count(prompt) > AI_SUMMARY_LIMIT:
             return "[Prompt too long for LLM context window, skipping summary.]"
-        return model.respond(prompt)
+        model = _llm()
+        # Keyed by model too, so switching the model loaded in LM Studio doesn't return stale summaries
+        key = hashlib.sha256(f"{model.identifier}\n{prompt}".encode()).hexdigest()
+        cached = db_get(LLM_CACHE_FILE, key, LLM_CACHE_TTL)
+        if cached is not None:
+            return cached
+        summary = str(model.respond(prompt))
     except Exception as e:
         return f"[AI summary failed: {e}]"
+    db_put(LLM_CACHE_FILE, key, summary)
+    return summary
+
+_DB_CONNECTIONS = {}
+_DB_LOCK = threading.Lock()
+
+def _cache_db(path):
+    conn = _DB_CONNECTIONS.get(path)
+    if conn is None:
+        # Shared with the LLM worker threads; every access goes through _DB_LOCK
+        conn = sqlite3.connect(path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, ts REAL, payload BLOB)")
+        _DB_CONNECTIONS[path] = conn
+    return conn
+
+def db_get(path, key, ttl=None):
+    with _DB_LOCK:
+        row = _cache_db(path).execute("SELECT ts, payload FROM cache WHERE key = ?", (key,)).fetchone()
+    if row is None or (ttl is not None and time.time() - row[0] >= ttl):
+        return None
+    return row[1]
+
+def db_put(path, key, payload):
+    with _DB_LOCK:
+        conn = _cache_db(path)
+        with conn:
+            conn.execute("INSERT OR REPLACE INTO cache (key, ts, payload) VALUES (?, ?, ?)", (key, time.time(), payload))
 
 def cache_key(date):
     return date
 
 def load_cache(date):
-    if not os.path.exists(CACHE_FILE):
-        return None
     try:
-        with open(CACHE_FILE, "r") as f:
-            data = json.load(f)
-        entry = data.get(cache_key(date))
-        if entry and time.time() - entry["timestamp"] < CACHE_TTL:
-            return entry["commits"]
+        payload = db_get(CACHE_FILE, cache_key(date), CACHE_TTL)
+        if payload is not None:
+            return _json_loads(payload)
     except Exception:
         pass
     return None
 
 def save_cache(date, commits):
-    key = cache_key(date)
-    data = {}
-    if os.path.exists(CACHE_FILE):
-        try:
-            with open(CACHE_FILE, "r") as f:
-                data = json.load(f)
-        except Exception:
-            data = {}
-    data[key] = {"timestamp": time.time(), "commits": commits}
-    with open(CACHE_FILE, "w") as f:
-        json.dump(data, f)
+    db_put(CACHE_FILE, cache_key(date), _json_dumps(commits))
 
 @click.command()
 @click.option('--date', default=datetime.now().strftime('%Y-%m-%d'), help='Date for which to aggregate pushed commits (YYYY-MM-DD)')
 @click.option('--github-token', envvar='GITHUB_TOKEN', help='GitHub token for API access')
 @click.option('--ai-summary/--no-ai-summary', default=False, help='Include an AI-generated summary of commit diffs')
-def main(date, github_token, ai_summary):  # type: ignore
+@click.option('--llm-workers', envvar='GITLOG_LLM_WORKERS', default=4, type=click.IntRange(min=1), help='Number of repositories to summarize concurrently')
+def main(date, github_token, ai_summary, llm_workers):  # type: ignore
     """
     Aggregate all pushed git commits across all your GitHub repositories for a given day and generate a summary.
     Optionally, generate an AI summary of the commit diffs using lmstudio.
@@ -106,41 +417,56 @@ def main(date, github_token, ai_summary):  # type: ignore
     if not github_token:
         print("GitHub token required for pushed commit summary.")
         return
+    session = create_session(github_token)
     print(f"Aggregating pushed commits for {date}...")
     gh_commits = load_cache(date)
     if gh_commits is None:
-        gh_commits = get_github_commits(github_token, date)
+        try:
+            gh_commits = get_github_commits(session, date)
+        except (RateLimitError, RuntimeError, requests.RequestException) as e:
+            print(f"Failed to fetch commits: {e}")
+            return
         save_cache(date, gh_commits)
     print_summary(gh_commits, date)
     if ai_summary:
         print("\nAI Summaries:")
-        g = Github(github_token)
-        user = g.get_user()
-        commit_summaries = []
-        for repo_name, commits in gh_commits:
-            repo = g.get_repo(repo_name)
-            commit_diffs = get_commit_diffs(repo, commits)
-            per_commit_summaries = []
-            for commit, diff in commit_diffs:
-                prompt = create_ai_prompt(repo_name, [(commit, diff)], date)
-                summary = get_ai_summary(prompt)
-                per_commit_summaries.append((commit, summary))
-                print(f"\nRepository: {repo_name}\nCommit: {commit}\n{summary}")
-            # Now, summarize all commit summaries for the repo if needed
-            all_commit_text = "\n".join([f"Commit: {c}\nSummary: {s}" for c, s in per_commit_summaries])
-            if estimate_token_count(all_commit_text) < AI_SUMMARY_LIMIT:
-                final_prompt = f"You are an expert software engineer. Summarize the following commit summaries for repository '{repo_name}' for {date}.\n\n{all_commit_text}\n\nFinal Summary:"
-                final_summary = get_ai_summary(final_prompt)
-                print(f"\nRepository: {repo_name}\nFinal AI Summary:\n{final_summary}")
-            else:
-                print(f"\nRepository: {repo_name}\n[Final summary skipped: too much content for LLM context window]")
+        try:
+            repo_diffs = asyncio.run(_fetch_all_diffs(github_token, gh_commits))
+        except (RateLimitError, aiohttp.ClientError, asyncio.TimeoutError) as e:
+            print(f"Failed to fetch commit diffs: {e}")
+            return
+        with ThreadPoolExecutor(max_workers=llm_workers) as ex:
+            results = ex.map(lambda rd: summarize_repo(rd[0], rd[1], date), repo_diffs)
+            for blocks in results:
+                sys.stdout.write("\n".join(blocks) + "\n")
+
+def summarize_repo(repo_name, commit_diffs, date):
+    batches = batch_commit_diffs(repo_name, commit_diffs, date, AI_SUMMARY_LIMIT)
+    batch_summaries = []
+    for batch in batches:
+        prompt = create_ai_prompt(repo_name, batch, date, AI_SUMMARY_LIMIT)
+        batch_summaries.append((batch, get_ai_summary(prompt)))
+    if len(batch_summaries) == 1:
+        return [f"\nRepository: {repo_name}\nAI Summary:\n{batch_summaries[0][1]}"]
+    # The commits did not fit in one prompt, so roll the batch summaries up
+    labels = [", ".join(c.split()[0] for c, _, _ in b) for b, _ in batch_summaries]
+    blocks = [f"\nRepository: {repo_name}\nCommits: {l}\n{s}" for l, (_, s) in zip(labels, batch_summaries)]
+    if sum(estimate_token_count(s) for _, s in batch_summaries) < ROLLUP_MIN_TOKENS:
+        # Short enough to read as is; another LLM call would only restate them
+        return blocks
+    final_prompt = create_final_prompt(repo_name, zip(labels, [s for _, s in batch_summaries]), date)
+    if estimate_token_count(final_prompt) < AI_SUMMARY_LIMIT:
+        final_summary = get_ai_summary(final_prompt)
+        return blocks + [f"\nRepository: {repo_name}\nFinal AI Summary:\n{final_summary}"]
+    blocks.append(f"\nRepository: {repo_name}\n[Final summary skipped: too much content for LLM context window]")
+    return blocks
 
 def print_summary(all_commits, date):
-    print(f"\nSummary of pushed commits for {date}:")
+    lines = [f"\nSummary of pushed commits for {date}:"]
     for repo, commits in all_commits:
-        print(f"\nRepository: {repo}")
-        for commit in commits:
-            print(f"  {commit}")
+        lines.append(f"\nRepository: {repo}")
+        lines.extend(f"  {commit}" for commit in commits)
+    sys.stdout.write("\n".join(lines) + "\n")
 
 if __name__ == '__main__':
     main()